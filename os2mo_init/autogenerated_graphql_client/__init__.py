@@ -2,6 +2,12 @@
 
 from .async_base_client import AsyncBaseClient
 from .base_model import BaseModel
+from .classes_query import ClassesQuery
+from .classes_query import ClassesQueryClasses
+from .classes_query import ClassesQueryClassesObjects
+from .classes_query import ClassesQueryClassesObjectsCurrent
+from .classes_query import ClassesQueryClassesObjectsCurrentFacet
+from .classes_query import ClassesQueryClassesObjectsCurrentItSystem
 from .client import GraphQLClient
 from .create_class_mutation import CreateClassMutation
 from .create_class_mutation import CreateClassMutationClassCreate
@@ -194,6 +200,12 @@ __all__ = [
     "ClassRegistrationFilter",
     "ClassTerminateInput",
     "ClassUpdateInput",
+    "ClassesQuery",
+    "ClassesQueryClasses",
+    "ClassesQueryClassesObjects",
+    "ClassesQueryClassesObjectsCurrent",
+    "ClassesQueryClassesObjectsCurrentFacet",
+    "ClassesQueryClassesObjectsCurrentItSystem",
     "CreateClassMutation",
     "CreateClassMutationClassCreate",
     "CreateFacetMutation",
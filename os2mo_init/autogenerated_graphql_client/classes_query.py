@@ -0,0 +1,46 @@
+# Generated by ariadne-codegen on 2026-05-08 14:12
+# Source: queries.graphql
+
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+from .base_model import BaseModel
+
+
+class ClassesQuery(BaseModel):
+    classes: "ClassesQueryClasses"
+
+
+class ClassesQueryClasses(BaseModel):
+    objects: List["ClassesQueryClassesObjects"]
+
+
+class ClassesQueryClassesObjects(BaseModel):
+    current: Optional["ClassesQueryClassesObjectsCurrent"]
+
+
+class ClassesQueryClassesObjectsCurrent(BaseModel):
+    facet: "ClassesQueryClassesObjectsCurrentFacet"
+    uuid: UUID
+    user_key: str
+    name: str
+    scope: Optional[str]
+    it_system: Optional["ClassesQueryClassesObjectsCurrentItSystem"]
+
+
+class ClassesQueryClassesObjectsCurrentFacet(BaseModel):
+    user_key: str
+
+
+class ClassesQueryClassesObjectsCurrentItSystem(BaseModel):
+    uuid: UUID
+    user_key: str
+
+
+ClassesQuery.update_forward_refs()
+ClassesQueryClasses.update_forward_refs()
+ClassesQueryClassesObjects.update_forward_refs()
+ClassesQueryClassesObjectsCurrent.update_forward_refs()
+ClassesQueryClassesObjectsCurrentFacet.update_forward_refs()
+ClassesQueryClassesObjectsCurrentItSystem.update_forward_refs()
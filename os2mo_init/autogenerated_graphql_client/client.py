@@ -1,6 +1,7 @@
 # Generated by ariadne-codegen on 2026-05-08 14:12
 # Source: queries.graphql
 
+from typing import List
 from typing import Optional
 from typing import Union
 from uuid import UUID
@@ -8,6 +9,8 @@ from uuid import UUID
 from .async_base_client import AsyncBaseClient
 from .base_model import UNSET
 from .base_model import UnsetType
+from .classes_query import ClassesQuery
+from .classes_query import ClassesQueryClasses
 from .create_class_mutation import CreateClassMutation
 from .create_class_mutation import CreateClassMutationClassCreate
 from .create_facet_mutation import CreateFacetMutation
@@ -245,3 +248,37 @@ class GraphQLClient(AsyncBaseClient):
         response = await self.execute(query=query, variables=variables)
         data = self.get_data(response)
         return GetClass.parse_obj(data).classes
+
+    async def classes_query(
+        self, facet_user_keys: List[str], class_user_keys: List[str]
+    ) -> ClassesQueryClasses:
+        query = gql("""
+            query ClassesQuery($facet_user_keys: [String!]!, $class_user_keys: [String!]!) {
+              classes(
+                filter: {user_keys: $class_user_keys, from_date: null, to_date: null, facet: {user_keys: $facet_user_keys}}
+              ) {
+                objects {
+                  current {
+                    facet {
+                      user_key
+                    }
+                    uuid
+                    user_key
+                    name
+                    scope
+                    it_system {
+                      uuid
+                      user_key
+                    }
+                  }
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "facet_user_keys": facet_user_keys,
+            "class_user_keys": class_user_keys,
+        }
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ClassesQuery.parse_obj(data).classes
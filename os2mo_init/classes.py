@@ -1,15 +1,25 @@
 # SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
 # SPDX-License-Identifier: MPL-2.0
+import asyncio
+from functools import partial
+from typing import Any
+from typing import Awaitable
+from typing import Callable
 from uuid import UUID
 
 import structlog
-from more_itertools import last
 
+from os2mo_init.autogenerated_graphql_client import ClassesQueryClassesObjectsCurrent
 from os2mo_init.autogenerated_graphql_client import GraphQLClient
+from os2mo_init.config import ConfigClass
 from os2mo_init.config import ConfigFacet
 
 logger = structlog.stdlib.get_logger()
 
+# Upper bound on class mutations sent to MO at once, to stay well within the
+# HTTP client's connection pool.
+MAX_CONCURRENT_MUTATIONS = 10
+
 
 async def ensure_classes(
     client: GraphQLClient,
@@ -33,7 +43,36 @@ async def ensure_classes(
         for o in (await client.i_t_systems_query()).objects
         if o.current is not None
     }
+    # Fetch all configured classes in one round-trip, instead of querying MO
+    # for each class individually.
+    existing_classes: dict[tuple[str, str], ClassesQueryClassesObjectsCurrent] = {}
+    classes_response = await client.classes_query(
+        facet_user_keys=list(config_classes.keys()),
+        class_user_keys=list(
+            {
+                user_key
+                for classes in config_classes.values()
+                for user_key, _ in classes.items()
+            }
+        ),
+    )
+    for o in classes_response.objects:
+        if o.current is None:
+            continue
+        key = (o.current.facet.user_key, o.current.user_key)
+        if key in existing_classes:
+            logger.warning(
+                "Multiple classes with the same user key, using the last",
+                facet=key[0],
+                user_key=key[1],
+            )
+        existing_classes[key] = o.current
 
+    # Mutations are collected and only issued once every class has been
+    # resolved, so a reference to a non-existent facet or IT system fails before
+    # anything is written. A failing mutation may still leave MO partially
+    # updated, as the remaining mutations are cancelled.
+    mutations: list[tuple[str, ConfigClass, Callable[[], Awaitable[Any]]]] = []
     for facet_user_key, classes in config_classes.items():
         for class_user_key, class_data in classes.items():
             it_system_uuid: UUID | None = None
@@ -47,36 +86,58 @@ async def ensure_classes(
                     ) from e
                 it_system_uuid = it_system.uuid
 
-            class_ = await client.get_class(facet_user_key, class_user_key)
-            obj = last(
-                class_.objects, default=None
-            )  # TODO: fail if more than one class?
-            if obj is None or obj.current is None:
-                logger.info("Creating class", data=class_data)
-                await client.create_class_mutation(
-                    facet_uuid=existing_facets_by_user_key[facet_user_key],
-                    user_key=class_user_key,
-                    name=class_data.title,
-                    scope=class_data.scope,
-                    it_system_uuid=it_system_uuid,
+            existing = existing_classes.get((facet_user_key, class_user_key))
+            if existing is None:
+                mutations.append(
+                    (
+                        "Creating class",
+                        class_data,
+                        partial(
+                            client.create_class_mutation,
+                            facet_uuid=existing_facets_by_user_key[facet_user_key],
+                            user_key=class_user_key,
+                            name=class_data.title,
+                            scope=class_data.scope,
+                            it_system_uuid=it_system_uuid,
+                        ),
+                    )
                 )
                 continue
 
-            existing = obj.current
             existing_it_system_uuid = (
                 existing.it_system.uuid if existing.it_system is not None else None
             )
             if (
                 existing.name != class_data.title
                 or existing.scope != class_data.scope
-                or existing_it_system_uuid != class_data.it_system
+                or existing_it_system_uuid != it_system_uuid
             ):
-                logger.info("Updating class", data=class_data)
-                await client.update_class_mutation(
-                    facet_uuid=existing_facets_by_user_key[facet_user_key],
-                    uuid=existing.uuid,
-                    user_key=class_user_key,
-                    name=class_data.title,
-                    scope=class_data.scope,
-                    it_system_uuid=it_system_uuid,
+                mutations.append(
+                    (
+                        "Updating class",
+                        class_data,
+                        partial(
+                            client.update_class_mutation,
+                            facet_uuid=existing_facets_by_user_key[facet_user_key],
+                            uuid=existing.uuid,
+                            user_key=class_user_key,
+                            name=class_data.title,
+                            scope=class_data.scope,
+                            it_system_uuid=it_system_uuid,
+                        ),
+                    )
                 )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_MUTATIONS)
+
+    async def send(
+        event: str, class_data: ConfigClass, mutation: Callable[[], Awaitable[Any]]
+    ) -> None:
+        async with semaphore:
+            logger.info(event, data=class_data)
+            await mutation()
+
+    # The task group cancels and awaits the remaining mutations if one fails.
+    async with asyncio.TaskGroup() as tg:
+        for event, class_data, mutation in mutations:
+            tg.create_task(send(event, class_data, mutation))
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: MPL-2.0
 
 import structlog
-from more_itertools import one
 
 from os2mo_init.autogenerated_graphql_client import GraphQLClient
 from os2mo_init.autogenerated_graphql_client import GraphQLClientGraphQLMultiError
@@ -18,7 +17,7 @@ async def get_root_org(client: GraphQLClient) -> RootOrgQueryOrg | None:
         result = await client.root_org_query()
     except GraphQLClientGraphQLMultiError as e:
         logger.debug("Error getting root org from MO", exc=e)
-        if one(e.errors).message == "ErrorCodes.E_ORG_UNCONFIGURED":
+        if [err.message for err in e.errors] == ["ErrorCodes.E_ORG_UNCONFIGURED"]:
             return None
         raise
     return result
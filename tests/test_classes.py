@@ -0,0 +1,225 @@
+# SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
+# SPDX-License-Identifier: MPL-2.0
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from structlog.testing import capture_logs
+
+from os2mo_init.autogenerated_graphql_client import ClassesQueryClasses
+from os2mo_init.autogenerated_graphql_client import FacetsQueryFacets
+from os2mo_init.autogenerated_graphql_client import ITSystemsQueryItsystems
+from os2mo_init.classes import ensure_classes
+from os2mo_init.config import ConfigFacet
+
+ADDRESS_TYPE_UUID = UUID("f3d6ea5a-3bb1-4c52-9c2f-9a6a6b1f2e01")
+VISIBILITY_UUID = UUID("0c5e7d3e-5f0a-4e4d-8a49-0f2b3c4d5e02")
+PHONE_UUID = UUID("5b3a2e91-7d4c-4f1a-b8e2-6c9d0a1b2c03")
+PUBLIC_UUID = UUID("8e1f4c2d-9a3b-4e5c-a6d7-1b2c3d4e5f04")
+OS2MO_UUID = UUID("2a4b6c8d-1e3f-4a5b-9c7d-e8f0a1b2c305")
+
+
+def class_object(
+    facet: str,
+    user_key: str,
+    uuid: UUID,
+    name: str,
+    scope: str | None = None,
+    it_system: tuple[UUID, str] | None = None,
+) -> dict[str, Any]:
+    return {
+        "current": {
+            "facet": {"user_key": facet},
+            "uuid": uuid,
+            "user_key": user_key,
+            "name": name,
+            "scope": scope,
+            "it_system": (
+                {"uuid": it_system[0], "user_key": it_system[1]}
+                if it_system is not None
+                else None
+            ),
+        }
+    }
+
+
+def mock_client(classes: list[dict[str, Any]]) -> AsyncMock:
+    client = AsyncMock()
+    client.facets_query.return_value = FacetsQueryFacets.parse_obj(
+        {
+            "objects": [
+                {
+                    "current": {
+                        "uuid": ADDRESS_TYPE_UUID,
+                        "user_key": "org_unit_address_type",
+                    }
+                },
+                {"current": {"uuid": VISIBILITY_UUID, "user_key": "visibility"}},
+            ]
+        }
+    )
+    client.i_t_systems_query.return_value = ITSystemsQueryItsystems.parse_obj(
+        {
+            "objects": [
+                {"current": {"uuid": OS2MO_UUID, "user_key": "OS2mo", "name": "OS2mo"}}
+            ]
+        }
+    )
+    client.classes_query.return_value = ClassesQueryClasses.parse_obj(
+        {"objects": classes}
+    )
+    return client
+
+
+async def test_ensure_classes_queries_configured_classes() -> None:
+    client = mock_client([])
+    config = {
+        "org_unit_address_type": ConfigFacet.parse_obj(
+            {
+                "PhoneUnit": {"title": "Telefon", "scope": "PHONE"},
+                "EmailUnit": {"title": "Email", "scope": "EMAIL"},
+            }
+        ),
+        "visibility": ConfigFacet.parse_obj({"Public": {"title": "Offentlig"}}),
+    }
+
+    await ensure_classes(client, config)
+
+    client.classes_query.assert_awaited_once()
+    kwargs = client.classes_query.await_args.kwargs
+    assert kwargs["facet_user_keys"] == ["org_unit_address_type", "visibility"]
+    assert sorted(kwargs["class_user_keys"]) == ["EmailUnit", "PhoneUnit", "Public"]
+
+
+async def test_ensure_classes_creates_class_without_current() -> None:
+    client = mock_client([{"current": None}])
+    config = {
+        "visibility": ConfigFacet.parse_obj(
+            {"Public": {"title": "Offentlig", "scope": "PUBLIC"}}
+        ),
+    }
+
+    await ensure_classes(client, config)
+
+    client.create_class_mutation.assert_awaited_once_with(
+        facet_uuid=VISIBILITY_UUID,
+        user_key="Public",
+        name="Offentlig",
+        scope="PUBLIC",
+        it_system_uuid=None,
+    )
+    client.update_class_mutation.assert_not_awaited()
+
+
+async def test_ensure_classes_duplicate_classes_uses_last() -> None:
+    client = mock_client(
+        [
+            class_object("visibility", "Public", PHONE_UUID, "Outdated", "PUBLIC"),
+            class_object("visibility", "Public", PUBLIC_UUID, "Offentlig", "PUBLIC"),
+        ]
+    )
+    config = {
+        "visibility": ConfigFacet.parse_obj(
+            {"Public": {"title": "Offentlig", "scope": "PUBLIC"}}
+        ),
+    }
+
+    with capture_logs() as logs:
+        await ensure_classes(client, config)
+
+    assert {
+        "event": "Multiple classes with the same user key, using the last",
+        "log_level": "warning",
+        "facet": "visibility",
+        "user_key": "Public",
+    } in logs
+    # The last class matches the configuration, so nothing is changed
+    client.create_class_mutation.assert_not_awaited()
+    client.update_class_mutation.assert_not_awaited()
+
+
+async def test_ensure_classes_unknown_it_system() -> None:
+    client = mock_client([])
+    config = {
+        "visibility": ConfigFacet.parse_obj(
+            {
+                "Public": {"title": "Offentlig"},
+                "Intern": {"title": "Intern", "it_system": "LDAP"},
+            }
+        ),
+    }
+
+    with pytest.raises(ValueError, match="non-existent it-system 'LDAP'"):
+        await ensure_classes(client, config)
+
+    client.create_class_mutation.assert_not_awaited()
+    client.update_class_mutation.assert_not_awaited()
+
+
+async def test_ensure_classes_mutations() -> None:
+    client = mock_client(
+        [
+            # Up to date, including the IT system
+            class_object(
+                "org_unit_address_type",
+                "PhoneUnit",
+                PHONE_UUID,
+                "Telefon",
+                "PHONE",
+                it_system=(OS2MO_UUID, "OS2mo"),
+            ),
+            # Outdated name
+            class_object("visibility", "Public", PUBLIC_UUID, "Old", "PUBLIC"),
+        ]
+    )
+    config = {
+        "org_unit_address_type": ConfigFacet.parse_obj(
+            {
+                "PhoneUnit": {
+                    "title": "Telefon",
+                    "scope": "PHONE",
+                    "it_system": "OS2mo",
+                },
+            }
+        ),
+        "visibility": ConfigFacet.parse_obj(
+            {
+                "Public": {"title": "Offentlig", "scope": "PUBLIC"},
+                "Intern": {"title": "Intern", "scope": "INTERNAL"},
+            }
+        ),
+    }
+
+    await ensure_classes(client, config)
+
+    client.create_class_mutation.assert_awaited_once_with(
+        facet_uuid=VISIBILITY_UUID,
+        user_key="Intern",
+        name="Intern",
+        scope="INTERNAL",
+        it_system_uuid=None,
+    )
+    client.update_class_mutation.assert_awaited_once_with(
+        facet_uuid=VISIBILITY_UUID,
+        uuid=PUBLIC_UUID,
+        user_key="Public",
+        name="Offentlig",
+        scope="PUBLIC",
+        it_system_uuid=None,
+    )
+
+
+async def test_ensure_classes_mutation_error() -> None:
+    client = mock_client([])
+    client.create_class_mutation.side_effect = ValueError("BOOM")
+    config = {
+        "visibility": ConfigFacet.parse_obj({"Public": {"title": "Offentlig"}}),
+    }
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await ensure_classes(client, config)
+
+    (error,) = exc_info.value.exceptions
+    assert isinstance(error, ValueError)
+    assert str(error) == "BOOM"
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
+# SPDX-License-Identifier: MPL-2.0
+from unittest.mock import AsyncMock
+
+import pytest
+
+from os2mo_init.autogenerated_graphql_client import GraphQLClientGraphQLError
+from os2mo_init.autogenerated_graphql_client import GraphQLClientGraphQLMultiError
+from os2mo_init.root_org import get_root_org
+
+
+def multi_error(*messages: str) -> GraphQLClientGraphQLMultiError:
+    return GraphQLClientGraphQLMultiError(
+        errors=[GraphQLClientGraphQLError(message=m) for m in messages],
+        data={},
+    )
+
+
+async def test_get_root_org_unconfigured() -> None:
+    client = AsyncMock()
+    client.root_org_query.side_effect = multi_error("ErrorCodes.E_ORG_UNCONFIGURED")
+    assert await get_root_org(client) is None
+
+
+@pytest.mark.parametrize(
+    "messages",
+    [
+        (),
+        ("Something went wrong",),
+        ("ErrorCodes.E_ORG_UNCONFIGURED", "Something went wrong"),
+    ],
+)
+async def test_get_root_org_reraises(messages: tuple[str, ...]) -> None:
+    client = AsyncMock()
+    error = multi_error(*messages)
+    client.root_org_query.side_effect = error
+    with pytest.raises(GraphQLClientGraphQLMultiError) as exc_info:
+        await get_root_org(client)
+    assert exc_info.value is error